@@ -1,9 +1,9 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+import altair as alt
 import numpy as np
-from datetime import datetime, timedelta
-import random # Added random import
+import pyarrow as pa
+from datetime import date, datetime
  
 # Set page configuration
 st.set_page_config(
@@ -22,57 +22,112 @@ st.sidebar.title("Filters")
 # st.sidebar.markdown("Filter controls will be here.") # Removed placeholder
  
 # Generate dummy data
-def generate_dummy_data():
-    today = datetime.now() # Moved today here for use in sales_df
+# Cached so widget interactions reuse the same frames; only a new seed
+# (bumped by the "Refresh Data" button) or a new day produces a fresh data set.
+# `today` is an argument so it is part of the cache key: the cache is shared
+# by all sessions, and dates must not stay frozen at the first session's day.
+@st.cache_data(show_spinner=False)
+def generate_dummy_data(seed, today):
+    rng = np.random.default_rng(seed)
+    today = pd.Timestamp(today) # Used for the dates in all frames
     # Sales by category
     categories = ['Electronics', 'Clothing', 'Food', 'Books', 'Home']
-    sales = np.random.randint(1000, 5000, size=len(categories))
+    sales = rng.integers(1000, 5000, size=len(categories))
     # Add 'Date' and 'Number of Customers'
-    dates = [today - timedelta(days=random.randint(0, 364)) for _ in categories]
-    num_customers = [random.randint(50, 200) for _ in categories]
+    dates = today - pd.to_timedelta(rng.integers(0, 365, size=len(categories)), unit='D')
+    num_customers = rng.integers(50, 201, size=len(categories))
     sales_df = pd.DataFrame({
-        'Category': categories,
+        'Category': pd.Categorical(categories, categories=categories),
         'Sales': sales,
         'Date': dates,
         'Number of Customers': num_customers
     })
    
-    # Monthly revenue (time series)
-    # today = datetime.now() # No longer needed here
-    month_dates = [(today - timedelta(days=30*i)).strftime('%Y-%m') for i in range(12)]
-    month_dates.reverse()  # Start from the oldest
-    revenue = np.cumsum(np.random.randint(500, 1500, size=len(month_dates)))
-    revenue_df = pd.DataFrame({'Month': month_dates, 'Revenue': revenue})
+    # Monthly revenue (time series), oldest month first. The datetime column is
+    # built here so the cached frame already carries it.
+    month_dt = pd.date_range(end=today, periods=12, freq='MS', normalize=True)
+    revenue = np.cumsum(rng.integers(500, 1500, size=len(month_dt)))
+    revenue_df = pd.DataFrame({'Month': month_dt.strftime('%Y-%m'), 'Month_dt': month_dt,
+                               'Revenue': revenue})
    
     # Customer segments
     segments = ['New', 'Returning', 'VIP', 'Inactive']
-    customers = np.random.randint(100, 500, size=len(segments))
-    customers_df = pd.DataFrame({'Segment': segments, 'Customers': customers})
+    customers = rng.integers(100, 500, size=len(segments))
+    customers_df = pd.DataFrame({'Segment': pd.Categorical(segments, categories=segments), 'Customers': customers})
    
     # Recent transactions
     products = ['Laptop', 'T-shirt', 'Groceries', 'Novel', 'Chair', 'Phone', 'Headphones', 'Shoes']
-    transactions = []
-    for i in range(10):
-        transactions.append({
-            'ID': f'TRX-{1000+i}',
-            'Date': (today - timedelta(days=i)).strftime('%Y-%m-%d'),
-            'Product': np.random.choice(products),
-            'Amount': np.random.randint(10, 500)
-        })
-    transactions_df = pd.DataFrame(transactions)
+    n_transactions = 10
+    date_dt = pd.Timestamp(today).normalize() - pd.to_timedelta(np.arange(n_transactions), unit='D')
+    transactions_df = pd.DataFrame({
+        'ID': [f'TRX-{1000+i}' for i in range(n_transactions)],
+        'Date': date_dt.strftime('%Y-%m-%d'),
+        'Date_dt': date_dt,
+        'Product': pd.Categorical(rng.choice(products, size=n_transactions), categories=products),
+        'Amount': rng.integers(10, 500, size=n_transactions)
+    })
+    # Keep the time series sorted so date filtering can binary-search the bounds
+    revenue_df = revenue_df.sort_values('Month_dt', ignore_index=True)
+    transactions_df = transactions_df.sort_values('Date_dt', ignore_index=True)
    
     return sales_df, revenue_df, customers_df, transactions_df
  
+# Rows of a frame sorted by `column` that fall within [start, end].
+# Binary search on the sorted column avoids building a full boolean mask.
+def slice_date_range(df, column, start, end):
+    lo = df[column].searchsorted(start, side='left')
+    hi = df[column].searchsorted(end, side='right')
+    return df.iloc[lo:hi]
+ 
+# Filter the data frames for the current sidebar selection.
+# The frames themselves are identified by the data key, i.e. (seed, date)
+# (leading underscores tell Streamlit not to hash them), so unchanged widget
+# state reuses the previously filtered frames.
+@st.cache_data(show_spinner=False)
+def apply_filters(data_key, _sales_df, _revenue_df, _transactions_df,
+                  start_date, end_date, categories):
+    # Convert sidebar date inputs to datetime objects for comparison
+    start_datetime = datetime.combine(start_date, datetime.min.time())
+    end_datetime = datetime.combine(end_date, datetime.max.time())
+
+    # Filter sales_df by category
+    if categories:
+        filtered_sales_df = _sales_df[_sales_df['Category'].isin(categories)]
+    else:
+        filtered_sales_df = _sales_df # Use all categories if none are selected (read-only, no copy needed)
+
+    # Filter revenue_df and transactions_df by date range
+    filtered_revenue_df = slice_date_range(_revenue_df, 'Month_dt', start_datetime, end_datetime)
+    filtered_transactions_df = slice_date_range(_transactions_df, 'Date_dt', start_datetime, end_datetime)
+
+    return filtered_sales_df, filtered_revenue_df, filtered_transactions_df
+ 
+# Arrow table behind the "Recent Transactions" table, newest first.
+# st.dataframe takes it as-is, so the pandas -> Arrow conversion only runs
+# when the data key or the date range changes.
+@st.cache_data(show_spinner=False)
+def transactions_table(data_key, start_date, end_date, _filtered_transactions_df):
+    display_df = _filtered_transactions_df[['ID', 'Date', 'Product', 'Amount']].iloc[::-1]
+    return pa.Table.from_pandas(display_df, preserve_index=False)
+ 
+# Seed for the cached data set; it only changes when the user asks for new data
+if "data_seed" not in st.session_state:
+    st.session_state["data_seed"] = 0
+
 # Create refresh button
 if st.button('Refresh Data'):
+    st.session_state["data_seed"] += 1
     st.success('Data refreshed successfully!')
  
-# Generate data
-sales_df, revenue_df, customers_df, transactions_df = generate_dummy_data()
+# Identifies the current data set: the seed plus the day it was generated for
+data_key = (st.session_state["data_seed"], date.today())
 
-# Convert date/month columns to datetime objects for filtering
-revenue_df['Month_dt'] = pd.to_datetime(revenue_df['Month'] + '-01')
-transactions_df['Date_dt'] = pd.to_datetime(transactions_df['Date'])
+# Generate data only when the seed or the day changes; other reruns reuse the
+# frames kept in session state (they are never mutated below)
+if st.session_state.get("data_loaded_key") != data_key:
+    st.session_state["data_frames"] = generate_dummy_data(*data_key)
+    st.session_state["data_loaded_key"] = data_key
+sales_df, revenue_df, customers_df, transactions_df = st.session_state["data_frames"]
 
 # --- Sidebar Filters ---
 st.sidebar.header("Date Range Filter")
@@ -92,31 +147,17 @@ end_date = st.sidebar.date_input("End date", overall_max_date,
                                  min_value=overall_min_date, max_value=overall_max_date)
 
 st.sidebar.header("Category Filter")
-all_categories = sales_df['Category'].unique()
+all_categories = list(sales_df['Category'].cat.categories)
 selected_categories = st.sidebar.multiselect("Select Categories",
                                              options=all_categories,
                                              default=all_categories)
 
 # --- Filter DataFrames based on sidebar inputs ---
-# Convert sidebar date inputs to datetime objects for comparison
-start_datetime = datetime.combine(start_date, datetime.min.time())
-end_datetime = datetime.combine(end_date, datetime.max.time())
-
-# Filter sales_df by category
-if selected_categories:
-    filtered_sales_df = sales_df[sales_df['Category'].isin(selected_categories)]
-else:
-    filtered_sales_df = sales_df.copy() # Use all categories if none are selected
-
-# Filter revenue_df by date range
-filtered_revenue_df = revenue_df[
-    (revenue_df['Month_dt'] >= start_datetime) & (revenue_df['Month_dt'] <= end_datetime)
-]
-
-# Filter transactions_df by date range
-filtered_transactions_df = transactions_df[
-    (transactions_df['Date_dt'] >= start_datetime) & (transactions_df['Date_dt'] <= end_datetime)
-]
+# Lists are unhashable, so the selection is passed to the cached filter as a tuple
+filtered_sales_df, filtered_revenue_df, filtered_transactions_df = apply_filters(
+    data_key, sales_df, revenue_df, transactions_df,
+    start_date, end_date, tuple(selected_categories)
+)
 
 # --- Main Page Layout ---
 
@@ -160,16 +201,31 @@ col3, col4 = st.columns(2) # Changed to col3, col4 to avoid conflict with col1,
 # Pie chart in first column (customer segments not filtered by date/category in this version)
 with col3: # Changed to col3
     st.subheader("Customer Segments")
-    fig, ax = plt.subplots(figsize=(8, 8)) # Matplotlib pie chart remains
-    ax.pie(customers_df['Customers'], labels=customers_df['Segment'], autopct='%1.1f%%',
-           colors=['#ff9999','#66b3ff','#99ff99','#ffcc99'])
-    st.pyplot(fig)
+    # Vega-Lite arc chart, rendered client-side instead of rasterized by matplotlib
+    segment_colors = alt.Scale(domain=list(customers_df['Segment']),
+                               range=['#ff9999','#66b3ff','#99ff99','#ffcc99'])
+    base = alt.Chart(customers_df).transform_joinaggregate(
+        Total='sum(Customers)'
+    ).transform_calculate(
+        Share='datum.Customers / datum.Total'
+    ).encode(
+        theta=alt.Theta('Customers:Q', stack=True),
+        color=alt.Color('Segment:N', scale=segment_colors, legend=None),
+        tooltip=['Segment', 'Customers', alt.Tooltip('Share:Q', format='.1%')]
+    )
+    slices = base.mark_arc(outerRadius=120)
+    # Segment names outside the slices and percentages on them, as the matplotlib pie had
+    segment_labels = base.mark_text(radius=140).encode(text='Segment:N', color=alt.value('black'))
+    share_labels = base.mark_text(radius=80).encode(text=alt.Text('Share:Q', format='.1%'),
+                                                    color=alt.value('black'))
+    st.altair_chart(slices + segment_labels + share_labels, use_container_width=True)
  
 # Table in second column (using filtered_transactions_df)
 with col4: # Changed to col4
     st.subheader("Recent Transactions")
     if not filtered_transactions_df.empty:
-        st.dataframe(filtered_transactions_df[['ID', 'Date', 'Product', 'Amount']]) # Display original Date string
+        st.dataframe(transactions_table(data_key, start_date, end_date,
+                                        filtered_transactions_df)) # Display original Date string
     else:
         st.warning("No transactions to display for selected date range.")
 
@@ -1,19 +1,58 @@
+import functools
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox
 # Assuming task_manager.py is in the same directory
 from task_manager import TaskManager, Task, VALID_PRIORITIES
-from datetime import datetime
-from typing import Optional, List, Any # Added Optional, List, Any
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Optional, List, Any, Dict, Tuple # Added Optional, List, Any
 
-# Imports for Matplotlib
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from collections import Counter
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 # Constants for filter options
-FILTER_PRIORITY_OPTIONS = ["All"] + VALID_PRIORITIES
+FILTER_PRIORITY_OPTIONS = ["All", *VALID_PRIORITIES]
 FILTER_STATUS_OPTIONS = ["All", "Pending", "Completed"]
+# Status column text, indexed by Task.completed (False -> 0, True -> 1)
+STATUS_LABELS = ("Pending", "Completed")
+# Accepted due date format (YYYY-MM-DD)
+ISO_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Number of task rows inserted into the Treeview at once; further rows are
+# inserted as the list is scrolled to the end
+TREE_ROW_BATCH = 100
+# Delay used to coalesce rapid filter changes into a single list refresh
+FILTER_DEBOUNCE_MS = 30
+# How often to check whether a background task load has finished
+LOAD_POLL_MS = 50
+
+# Chart colors
+PRIORITY_COLORS = {'Low': '#4CAF50', 'Medium': '#FFC107', 'High': '#F44336'}
+PRIORITY_BAR_COLORS = tuple(PRIORITY_COLORS.get(p, '#CCCCCC') for p in VALID_PRIORITIES) # Default color for safety
+COMPLETION_COLORS = ('#4CAF50', '#FF9800')  # Green for completed, Orange for pending
+
+
+@functools.lru_cache(maxsize=None)
+def _configure_matplotlib() -> None:
+    """
+    Imports and configures Matplotlib. It is only needed by StatsWindow, so it is
+    loaded on first use instead of at startup; later calls are no-ops.
+
+    Only the object-oriented Figure API is used (never pyplot), so figures are not
+    registered with pyplot and are freed with their window. Charts are embedded
+    through FigureCanvasTkAgg, so no interactive pyplot backend is needed. The small
+    static charts do not need LaTeX text or automatic layout, and long paths are
+    simplified and drawn in chunks.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    matplotlib.rcParams.update({
+        "path.simplify": True,
+        "path.simplify_threshold": 1.0,
+        "agg.path.chunksize": 10000,
+        "text.usetex": False,
+        "figure.autolayout": False,
+        "axes.unicode_minus": False,
+    })
 
 
 class StatsWindow(tk.Toplevel):
@@ -40,125 +79,151 @@ class StatsWindow(tk.Toplevel):
         self.transient(parent)  # Ensure dialog stays on top of the parent window
         self.grab_set()  # Make the dialog modal
 
-        tasks: List[Task] = self.task_manager.get_all_tasks()
+        _configure_matplotlib()
+
+        # All figures come from one counting pass, cached by the TaskManager
+        total_tasks, completed_tasks, priority_counts = self.task_manager.get_task_counts()
 
         main_frame = ttk.Frame(self, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
-        self._display_summary_stats(tasks, main_frame)
+        self._display_summary_stats(total_tasks, completed_tasks, main_frame)
 
         charts_frame = ttk.Frame(main_frame)
         charts_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
 
-        self._display_priority_chart(tasks, charts_frame)
-        self._display_completion_chart(tasks, charts_frame)
+        self._display_priority_chart(total_tasks, priority_counts, charts_frame)
+        self._display_completion_chart(total_tasks, completed_tasks, charts_frame)
 
-    def _display_summary_stats(self, tasks: List[Task], parent_frame: ttk.Frame) -> None:
+    def _display_summary_stats(self, total_tasks: int, completed_tasks: int, parent_frame: ttk.Frame) -> None:
         """
         Displays textual summary statistics of tasks.
 
         Args:
-            tasks: A list of Task objects to summarize.
+            total_tasks: The total number of tasks.
+            completed_tasks: The number of completed tasks.
             parent_frame: The parent ttk.Frame in which to place these stats.
         """
         summary_frame = ttk.LabelFrame(
             parent_frame, text="Summary Statistics", padding="10")
         summary_frame.pack(fill=tk.X, pady=5)
 
-        total_tasks = len(tasks)
-        completed_tasks = sum(1 for task in tasks if task.completed)
         pending_tasks = total_tasks - completed_tasks
 
         ttk.Label(summary_frame, text=f"Total Tasks: {total_tasks}").pack(anchor="w")
         ttk.Label(summary_frame, text=f"Completed Tasks: {completed_tasks}").pack(anchor="w")
         ttk.Label(summary_frame, text=f"Pending Tasks: {pending_tasks}").pack(anchor="w")
 
-        if not tasks:
+        if not total_tasks:
             ttk.Label(summary_frame, text="No tasks available to generate detailed statistics.").pack(
                 anchor="w", pady=5)
 
-    def _display_priority_chart(self, tasks: List[Task], parent_frame: ttk.Frame) -> None:
+    def _display_priority_chart(self, total_tasks: int, priority_counts: Dict[str, int],
+                                parent_frame: ttk.Frame) -> None:
         """
         Displays a bar chart showing the distribution of tasks by priority.
 
         Args:
-            tasks: A list of Task objects.
+            total_tasks: The total number of tasks.
+            priority_counts: The number of tasks for each level in VALID_PRIORITIES.
             parent_frame: The parent ttk.Frame for the chart.
         """
         priority_frame = ttk.LabelFrame(parent_frame, text="Task Priorities", padding="10")
         priority_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        if not tasks:
+        if not total_tasks:
             ttk.Label(priority_frame, text="No data to display.").pack(padx=10, pady=10)
             return
 
-        priority_counts = Counter(task.priority for task in tasks)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         # Use VALID_PRIORITIES to ensure consistent order and inclusion of all levels
         counts = [priority_counts.get(p, 0) for p in VALID_PRIORITIES]
 
-        fig = Figure(figsize=(5, 4), dpi=100)
-        ax = fig.add_subplot(111)
+        # The figure is kept on the parent between openings; only the bar heights
+        # and count labels change, so the artists are updated instead of rebuilt.
+        chart = self.parent._priority_chart
+        if chart is None:
+            fig = Figure(figsize=(5, 4), dpi=100)
+            ax = fig.add_subplot(111)
+
+            bars = ax.bar(VALID_PRIORITIES, counts, color=PRIORITY_BAR_COLORS)
+            ax.set_title("Distribution by Priority")
+            ax.set_ylabel("Number of Tasks")
+            ax.set_xlabel("Priority Level")
 
-        colors = {'Low': '#4CAF50', 'Medium': '#FFC107', 'High': '#F44336'}
-        bar_colors = [colors.get(p, '#CCCCCC') for p in VALID_PRIORITIES] # Default color for safety
+            count_labels: List[Any] = []  # Filled by bar_label below
 
-        bars = ax.bar(VALID_PRIORITIES, counts, color=bar_colors)
-        ax.set_title("Distribution by Priority")
-        ax.set_ylabel("Number of Tasks")
-        ax.set_xlabel("Priority Level")
+            # Fixed margins for the fixed 5x4in figure, instead of running the tight_layout solver
+            fig.subplots_adjust(left=0.12, right=0.95, top=0.90, bottom=0.12)
+            chart = self.parent._priority_chart = (fig, ax, bars, count_labels)
 
-        # Add counts on top of bars for clarity
-        for bar in bars:
-            yval = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width() / 2.0, yval + 0.05, int(yval), ha='center', va='bottom')
+        fig, ax, bars, count_labels = chart
+        for bar, count in zip(bars, counts):
+            bar.set_height(count)
 
-        fig.tight_layout()  # Adjust layout to prevent labels from overlapping
+        # Add counts on top of bars for clarity, replacing those of the previous opening.
+        # Labels are passed explicitly: the container's own values are the initial heights.
+        for count_label in count_labels:
+            count_label.remove()
+        count_labels[:] = ax.bar_label(bars, labels=[str(count) for count in counts], padding=3)
+        ax.relim()
+        ax.autoscale_view()
 
         canvas = FigureCanvasTkAgg(fig, master=priority_frame)
         canvas_widget = canvas.get_tk_widget()
         canvas_widget.pack(fill=tk.BOTH, expand=True)
-        canvas.draw()
+        canvas.draw_idle()
 
-    def _display_completion_chart(self, tasks: List[Task], parent_frame: ttk.Frame) -> None:
+    def _display_completion_chart(self, total_tasks: int, completed_count: int,
+                                  parent_frame: ttk.Frame) -> None:
         """
         Displays a pie chart showing the proportion of completed vs. pending tasks.
 
         Args:
-            tasks: A list of Task objects.
+            total_tasks: The total number of tasks.
+            completed_count: The number of completed tasks.
             parent_frame: The parent ttk.Frame for the chart.
         """
         completion_frame = ttk.LabelFrame(parent_frame, text="Task Completion Status", padding="10")
         completion_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        if not tasks:
+        if not total_tasks:
             ttk.Label(completion_frame, text="No data to display.").pack(padx=10, pady=10)
             return
 
-        completed_count = sum(1 for task in tasks if task.completed)
-        pending_count = len(tasks) - completed_count
+        pending_count = total_tasks - completed_count
 
         if completed_count == 0 and pending_count == 0:
             ttk.Label(completion_frame, text="No tasks with completion status.").pack(padx=10, pady=10)
             return
 
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         labels = 'Completed', 'Pending'
         sizes = [completed_count, pending_count]
-        colors = ['#4CAF50', '#FF9800']  # Green for completed, Orange for pending
-        explode = (0.1, 0) if completed_count > 0 and pending_count > 0 else (0, 0)  # Explode if both slices exist
 
-        fig = Figure(figsize=(5, 4), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.pie(sizes, explode=explode, labels=labels, colors=colors, autopct='%1.1f%%',
-               shadow=True, startangle=90)
+        # The figure and axes are kept on the parent between openings. Wedge
+        # geometry depends on every slice, so the pie itself is redrawn (without
+        # shadow or explode, which add extra patches and paths to every draw).
+        if self.parent._completion_chart is None:
+            fig = Figure(figsize=(5, 4), dpi=100)
+            # Fixed margins (the pie has no axis labels), instead of running the tight_layout solver
+            fig.subplots_adjust(left=0.05, right=0.95, top=0.90, bottom=0.05)
+            self.parent._completion_chart = (fig, fig.add_subplot(111))
+        fig, ax = self.parent._completion_chart
+
+        ax.clear()
+        ax.pie(sizes, labels=labels, colors=COMPLETION_COLORS, autopct='%1.1f%%', startangle=90)
         ax.axis('equal')  # Ensures pie is drawn as a circle.
         ax.set_title("Completion Status")
 
-        fig.tight_layout()
-
         canvas = FigureCanvasTkAgg(fig, master=completion_frame)
         canvas_widget = canvas.get_tk_widget()
         canvas_widget.pack(fill=tk.BOTH, expand=True)
-        canvas.draw()
+        canvas.draw_idle()
 
 
 class TaskDialog(tk.Toplevel):
@@ -266,7 +331,11 @@ class TaskDialog(tk.Toplevel):
 
         due_date_str = self.due_date_entry.get().strip()
         try:
-            datetime.strptime(due_date_str, "%Y-%m-%d")
+            # The regex pins the exact shape (fromisoformat also accepts e.g. "20240101");
+            # fromisoformat then rejects impossible dates without strptime's format parsing
+            if not ISO_DATE_PATTERN.fullmatch(due_date_str):
+                raise ValueError(due_date_str)
+            date.fromisoformat(due_date_str)
         except ValueError:
             messagebox.showerror("Validation Error", "Due date must be in YYYY-MM-DD format.", parent=self)
             return False
@@ -339,6 +408,17 @@ class MainApplication(tk.Tk):
         """
         super().__init__()
         self.task_manager = task_manager_instance
+        # Statistics chart figures, built on the first StatsWindow and reused afterwards
+        self._priority_chart: Optional[Tuple["Figure", Any, Any, List[Any]]] = None
+        self._completion_chart: Optional[Tuple["Figure", Any]] = None
+        # ID of the scheduled (debounced) filter refresh, if any
+        self._refresh_pending: Optional[str] = None
+        # Task of the selected row, resolved once per selection change
+        self._selected_task: Optional[Task] = None
+        # Rows of the current view; the Treeview is filled in batches as it is scrolled
+        self._pending_rows: List[Tuple[str, str, str, str, str]] = []
+        self._rows_inserted = 0
+        self._row_insert_scheduled = False
 
         self.title("TkTask - Task Manager")
         self.geometry("850x600") # Slightly wider for the stats button
@@ -347,9 +427,32 @@ class MainApplication(tk.Tk):
         self._create_task_list_widgets()
         self._create_status_bar()
 
-        self._refresh_task_list()
+        if self.task_manager.is_loaded:
+            self._refresh_task_list()
+        else:
+            # Tasks are still loading on a background thread (TaskManager.load_async);
+            # show the empty window now and fill it in once they are available
+            self._update_status_bar("Loading tasks...")
+            self.after(LOAD_POLL_MS, self._poll_task_loading)
         self._update_button_states()
 
+    def _poll_task_loading(self) -> None:
+        """
+        Checks whether the background task load has finished. Reschedules itself until it
+        has, then shows the tasks (with the current filters), or reports a load error and closes.
+        """
+        if not self.task_manager.is_loaded:
+            self.after(LOAD_POLL_MS, self._poll_task_loading)
+            return
+        if self.task_manager.load_error is not None:
+            messagebox.showerror("TaskManager Initialization Error",
+                                 f"A critical error occurred while loading tasks: {self.task_manager.load_error}\n"
+                                 "The application cannot continue and will now exit.", parent=self)
+            self.destroy()
+            return
+        self._apply_filters()
+        self._update_status_bar(f"Loaded {len(self.task_manager)} tasks.")
+
     def _create_control_widgets(self) -> None:
         """Creates and places the control buttons and filter widgets."""
         controls_frame = ttk.Frame(self, padding="10")
@@ -419,11 +522,11 @@ class MainApplication(tk.Tk):
         self.task_tree.column("status", width=100, anchor="center")
 
         # Scrollbar
-        tree_scrollbar = ttk.Scrollbar(task_list_frame, orient=tk.VERTICAL, command=self.task_tree.yview)
-        self.task_tree.configure(yscrollcommand=tree_scrollbar.set)
+        self.tree_scrollbar = ttk.Scrollbar(task_list_frame, orient=tk.VERTICAL, command=self.task_tree.yview)
+        self.task_tree.configure(yscrollcommand=self._on_task_tree_yscroll)
 
         self.task_tree.grid(row=0, column=0, sticky="nsew")
-        tree_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.tree_scrollbar.grid(row=0, column=1, sticky="ns")
 
         # Make the Treeview expandable
         task_list_frame.grid_rowconfigure(0, weight=1)
@@ -446,48 +549,79 @@ class MainApplication(tk.Tk):
     def _refresh_task_list(self, tasks_to_display: Optional[List[Task]] = None) -> None:
         """
         Clears and repopulates the task list Treeview.
-        Tasks are sorted by due date (ascending) then by priority (High, Medium, Low).
+        Tasks are shown in the order given; the TaskManager already keeps them sorted
+        by due date (ascending) then by priority (High, Medium, Low).
 
         Args:
-            tasks_to_display: Optional. A specific list of tasks to display.
+            tasks_to_display: Optional. A specific, already sorted list of tasks to display.
                               If None, all tasks from TaskManager are fetched.
         """
-        for item in self.task_tree.get_children():
-            self.task_tree.delete(item)
-
-        tasks = tasks_to_display if tasks_to_display is not None else self.task_manager.get_all_tasks()
+        children = self.task_tree.get_children()
+        if children:
+            self.task_tree.delete(*children)  # One Tcl call for all rows
+        self._selected_task = None  # The rows (and thus the selection) are rebuilt
 
-        # Sort tasks: Primary key due_date (chronological), Secondary key priority (High=0, Medium=1, Low=2)
-        priority_map = {p: i for i, p in enumerate(VALID_PRIORITIES)} # High=0, Medium=1, Low=2
-        try:
-            tasks.sort(key=lambda t: (datetime.strptime(t.due_date, "%Y-%m-%d"), priority_map.get(t.priority, len(VALID_PRIORITIES))))
-        except ValueError as e: # Handle potential malformed due dates if TaskManager validation was bypassed
-            print(f"Warning: Error sorting tasks by due date - {e}. Some dates might be malformed.")
-            tasks.sort(key=lambda t: priority_map.get(t.priority, len(VALID_PRIORITIES))) # Fallback sort by priority
+        tasks = tasks_to_display if tasks_to_display is not None else self.task_manager.get_sorted_tasks()
 
-        for task in tasks:
-            status_str = "Completed" if task.completed else "Pending"
-            self.task_tree.insert("", tk.END, values=(task.id, task.title, task.priority, task.due_date, status_str))
+        # Build every row up front; only the first batch is inserted now, the rest
+        # as the user scrolls towards the end (see _on_task_tree_yscroll)
+        self._pending_rows = [(task.id, task.title, task.priority, task.due_date, STATUS_LABELS[task.completed])
+                              for task in tasks]
+        self._rows_inserted = 0
+        self._insert_next_rows()
 
         self._update_button_states()
 
+    def _insert_next_rows(self) -> None:
+        """Inserts the next TREE_ROW_BATCH not yet displayed rows into the task Treeview."""
+        self._row_insert_scheduled = False
+        start = self._rows_inserted
+        end = min(start + TREE_ROW_BATCH, len(self._pending_rows))
+        for values in self._pending_rows[start:end]:
+            # Use the task ID as the item ID so Tk does not have to generate one
+            self.task_tree.insert("", tk.END, iid=values[0], values=values)
+        self._rows_inserted = end
+
+    def _on_task_tree_yscroll(self, first: str, last: str) -> None:
+        """
+        yscrollcommand of the task Treeview. Updates the scrollbar and, once the view
+        reaches the last inserted row, schedules insertion of the next batch of rows.
+
+        Args:
+            first: The fraction of the list above the visible area, as sent by Tk.
+            last: The fraction of the list up to the end of the visible area, as sent by Tk.
+        """
+        self.tree_scrollbar.set(first, last)
+        if (float(last) >= 1.0 and not self._row_insert_scheduled
+                and self._rows_inserted < len(self._pending_rows)):
+            self._row_insert_scheduled = True
+            self.after_idle(self._insert_next_rows)
+
     def _filter_tasks(self, event: Optional[Any] = None) -> None: # event is passed by bind, can be None
+        """
+        Schedules a filtered refresh of the task list. Filter changes arriving within
+        FILTER_DEBOUNCE_MS of each other are coalesced, so only the last one rebuilds the list.
+        """
+        if self._refresh_pending is not None:
+            self.after_cancel(self._refresh_pending)
+        self._refresh_pending = self.after(FILTER_DEBOUNCE_MS, self._apply_filters)
+
+    def _apply_filters(self) -> None:
         """
         Filters tasks based on selected criteria in priority and status comboboxes,
         then refreshes the task list.
         """
+        self._refresh_pending = None
+        if not self.task_manager.is_loaded:
+            return  # The filters are applied once loading finishes
         priority_filter = self.priority_filter_var.get()
         status_filter = self.status_filter_var.get()
 
-        # Start with all tasks and apply filters sequentially
-        current_tasks = self.task_manager.get_all_tasks()
-
-        if priority_filter != "All":
-            current_tasks = [task for task in current_tasks if task.priority == priority_filter]
+        # Resolve both filters once (None means "All"); the TaskManager applies them in a single pass
+        want_priority = None if priority_filter == "All" else priority_filter
+        want_completed = None if status_filter == "All" else (status_filter == "Completed")
 
-        if status_filter != "All":
-            status_bool = (status_filter == "Completed")
-            current_tasks = [task for task in current_tasks if task.completed == status_bool]
+        current_tasks = self.task_manager.get_filtered_tasks(want_priority, want_completed)
 
         self._refresh_task_list(tasks_to_display=current_tasks)
         self._update_status_bar(f"Filtered view: Priority '{priority_filter}', Status '{status_filter}'.")
@@ -513,34 +647,23 @@ class MainApplication(tk.Tk):
 
     def _open_edit_task_dialog(self, event: Optional[Any] = None) -> None: # event from double-click
         """Opens the TaskDialog to edit the currently selected task."""
-        selected_task_id = self._get_selected_task_id()
-        if not selected_task_id:
+        task = self._selected_task
+        if task is None:
             messagebox.showerror("Error", "No task selected. Please select a task to edit.", parent=self)
             return
 
-        task_object = self.task_manager.get_task(selected_task_id)
-        if task_object:
-            TaskDialog(self, self.task_manager, task_data=task_object)
-        else: # Should ideally not happen if list is in sync with backend
-            messagebox.showerror("Error", "Could not find the selected task. It might have been deleted.", parent=self)
-            self._refresh_task_list()
+        TaskDialog(self, self.task_manager, task_data=task)
 
     def _delete_selected_task(self) -> None:
         """Deletes the selected task from the TaskManager after user confirmation."""
-        selected_task_id = self._get_selected_task_id()
-        if not selected_task_id:
+        task = self._selected_task
+        if task is None:
             messagebox.showerror("Error", "No task selected. Please select a task to delete.", parent=self)
             return
 
-        task = self.task_manager.get_task(selected_task_id) # Get task details for confirmation message
-        if not task: # Should not happen
-            messagebox.showerror("Error", "Task not found for deletion.", parent=self)
-            self._refresh_task_list()
-            return
-
         confirm = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete task: '{task.title}'?", parent=self)
         if confirm:
-            if self.task_manager.delete_task(selected_task_id):
+            if self.task_manager.delete_task(task.id):
                 self._refresh_task_list()
                 self._update_status_bar(f"Task '{task.title}' deleted.")
             else: # Deletion failed in backend for some reason
@@ -549,37 +672,31 @@ class MainApplication(tk.Tk):
 
     def _toggle_selected_task_completion(self) -> None:
         """Toggles the completion status of the selected task."""
-        selected_task_id = self._get_selected_task_id()
-        if not selected_task_id:
+        task = self._selected_task
+        if task is None:
             messagebox.showerror("Error", "No task selected. Please select a task to toggle completion.", parent=self)
             return
 
-        task_before_toggle = self.task_manager.get_task(selected_task_id)
-        if not task_before_toggle: # Should not happen
-            messagebox.showerror("Error", "Task not found for toggling.", parent=self)
-            self._refresh_task_list()
-            return
-
-        if self.task_manager.toggle_complete(selected_task_id):
+        if self.task_manager.toggle_complete(task.id):
             self._refresh_task_list()
-            # Status bar message should reflect the new state
-            current_task_state = self.task_manager.get_task(selected_task_id)
-            if current_task_state:
-                 new_status_str = "Completed" if current_task_state.completed else "Pending"
-                 self._update_status_bar(f"Task '{current_task_state.title}' marked as {new_status_str}.")
-            else: # Task somehow disappeared after toggle, refresh and generic message
-                 self._update_status_bar(f"Task completion status toggled.")
+            # Status bar message should reflect the new state (the Task object is updated in place)
+            self._update_status_bar(f"Task '{task.title}' marked as {STATUS_LABELS[task.completed]}.")
         else:
             messagebox.showerror("Error", "Failed to toggle task completion.", parent=self)
             self._refresh_task_list()
 
     def _on_task_select(self, event: Optional[Any] = None) -> None: # event from TreeviewSelect
-        """Callback for when a task selection changes in the Treeview."""
+        """
+        Callback for when a task selection changes in the Treeview.
+        Resolves the selected Task once, so the action handlers need no further lookup.
+        """
+        selected_task_id = self._get_selected_task_id()
+        self._selected_task = self.task_manager.get_task(selected_task_id) if selected_task_id else None
         self._update_button_states()
 
     def _open_stats_window(self) -> None:
         """Opens the statistics window if tasks are available."""
-        if not self.task_manager.get_all_tasks():
+        if len(self.task_manager) == 0:
             messagebox.showinfo("Statistics", "No tasks available to generate statistics.", parent=self)
             return
         StatsWindow(self, self.task_manager)
@@ -588,9 +705,13 @@ class MainApplication(tk.Tk):
         """
         Enables or disables control buttons based on whether a task is selected
         and whether any tasks exist at all (for the stats button).
+        Adding tasks and statistics are unavailable until the tasks have loaded.
         """
-        is_task_selected = self._get_selected_task_id() is not None
-        any_tasks_exist = bool(self.task_manager.get_all_tasks())
+        is_loaded = self.task_manager.is_loaded
+        is_task_selected = self._selected_task is not None
+        any_tasks_exist = is_loaded and len(self.task_manager) > 0
+
+        self.add_button.config(state=tk.NORMAL if is_loaded else tk.DISABLED)
 
         self.edit_button.config(state=tk.NORMAL if is_task_selected else tk.DISABLED)
         self.delete_button.config(state=tk.NORMAL if is_task_selected else tk.DISABLED)
@@ -5,11 +5,10 @@ This script initializes the TaskManager and the Tkinter-based GUI (MainApplicati
 to run the task management application. It includes top-level error handling
 for application startup and runtime issues.
 """
-import tkinter as tk
-from tkinter import messagebox
 import sys
-from gui import MainApplication
 from task_manager import TaskManager
+# tkinter and gui are imported inside main() once they are needed, so loading
+# the tasks does not wait on GUI toolkit initialization.
 
 
 # Define the path for the tasks JSON file.
@@ -33,8 +32,11 @@ def main() -> None:
         # and json.JSONDecodeError by starting with an empty task list,
         # creating tasks.json if it doesn't exist upon first save.
         # This try-except block is for other unexpected critical errors during
-        # TaskManager instantiation (e.g., permission issues, programming errors).
-        tm_instance = TaskManager(filepath=TASKS_FILE_PATH)
+        # TaskManager instantiation (e.g., programming errors).
+        # The tasks themselves are loaded on a background thread while the GUI
+        # starts up; errors from that load are reported by the GUI.
+        tm_instance = TaskManager(filepath=TASKS_FILE_PATH, lazy=True)
+        tm_instance.load_async()
     except Exception as e:
         error_title = "TaskManager Initialization Error"
         error_message = (
@@ -43,6 +45,8 @@ def main() -> None:
         )
         print(f"{error_title}: {error_message}", file=sys.stderr)
 
+        import tkinter as tk
+        from tkinter import messagebox
         try:
             # Attempt to show a Tkinter messagebox. A hidden root window is needed.
             root_err = tk.Tk()
@@ -63,13 +67,19 @@ def main() -> None:
         # This block should ideally not be reached if the above sys.exit works.
         critical_error_msg = "TaskManager instance is None. Application cannot start."
         print(critical_error_msg, file=sys.stderr)
+        import tkinter as tk
+        from tkinter import messagebox
         root_fallback = tk.Tk()
         root_fallback.withdraw()
         messagebox.showerror("Critical Startup Error", critical_error_msg)
         root_fallback.destroy()
         sys.exit(1)
 
+    import tkinter as tk
+    from tkinter import messagebox
+
     try:
+        from gui import MainApplication  # Pulls in the rest of the GUI code
         app = MainApplication(task_manager_instance=tm_instance)
         app.mainloop()
     except Exception as e:
@@ -96,6 +106,9 @@ def main() -> None:
         except Exception as me:
             print(f"Error displaying runtime error messagebox: {me}", file=sys.stderr)
         sys.exit(1) # Exit on critical runtime error
+    finally:
+        # Fold the change journal into tasks.json before exiting
+        tm_instance.close()
 
 
 if __name__ == "__main__":
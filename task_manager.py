@@ -1,10 +1,94 @@
+import bisect
 import json
-import uuid
+import os
+import re
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional, Dict, Any # Added Optional, List, Dict, Any for precise type hinting
+from operator import attrgetter
+from typing import List, Optional, Dict, Any, BinaryIO, Iterator, Tuple # Added Optional, List, Dict, Any for precise type hinting
+
+try:
+    import orjson  # Optional, much faster JSON encoder/decoder
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional, streaming JSON parser for large task files
+except ImportError:
+    ijson = None
+
+# Errors that mean the task file is not valid JSON
+_JSON_DECODE_ERRORS: Tuple[type, ...] = (json.JSONDecodeError, UnicodeDecodeError)
+if ijson is not None:
+    _JSON_DECODE_ERRORS += (ijson.JSONError,)
 
 # Define valid priority levels as a constant for easier maintenance and validation
-VALID_PRIORITIES = ["High", "Medium", "Low"]
+# A tuple keeps the display order (High first); membership tests use the frozenset
+VALID_PRIORITIES = ("High", "Medium", "Low")
+_VALID_PRIORITIES_SET = frozenset(VALID_PRIORITIES)
+
+# Sort rank of each priority level (High first); unknown levels sort last
+_PRIORITY_RANK = {p: i for i, p in enumerate(VALID_PRIORITIES)}
+
+# Shape of a "YYYY-MM-DD" due date; datetime() then rejects impossible days such as 2023-02-30
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+# The files are only read by this class, so write compact JSON (no indentation or padding)
+_JSON_SEPARATORS = (',', ':')
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serializes `obj` to compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=_JSON_SEPARATORS, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parses UTF-8 JSON bytes, using orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If `data` is not valid JSON (orjson's error is a subclass).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Task files larger than this (in bytes) are parsed incrementally with ijson, if installed
+STREAM_LOAD_THRESHOLD = 1024 * 1024
+
+# Number of journaled changes after which the journal is folded into the snapshot file
+JOURNAL_COMPACT_THRESHOLD = 500
+
+
+class _UUIDPool:
+    """
+    Hands out random (version 4) UUID hex strings cut from a pre-read block of
+    os.urandom() bytes, so creating many tasks does not cost one urandom call each.
+    """
+
+    def __init__(self, size: int = 1024):
+        self._size: int = size
+        self._buf: bytes = b""
+        self._next: int = size  # Forces a refill on first use
+
+    def next_hex(self) -> str:
+        """Returns the next UUID as 32 hex digits, like uuid.uuid4().hex."""
+        if self._next >= self._size:
+            self._buf = os.urandom(16 * self._size)
+            self._next = 0
+        offset = self._next * 16
+        self._next += 1
+        raw = bytearray(self._buf[offset:offset + 16])
+        raw[6] = (raw[6] & 0x0F) | 0x40  # Version 4
+        raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+        return raw.hex()
+
+
+_uuid_pool = _UUIDPool()
 
 
 class Task:
@@ -20,6 +104,9 @@ class Task:
         completed (bool): The completion status of the task, True if completed, False otherwise.
     """
 
+    # No per-instance __dict__: keeps each task small and attribute access fast
+    __slots__ = ('id', 'title', 'description', 'priority', 'due_date', 'completed')
+
     def __init__(self, title: str, description: str, priority: str, due_date: str,
                  completed: bool = False, id: Optional[str] = None):
         """
@@ -33,7 +120,7 @@ class Task:
             completed: The completion status of the task. Defaults to False.
             id: Optional. The unique ID of the task. If None, a new UUID is generated.
         """
-        self.id: str = id if id else uuid.uuid4().hex
+        self.id: str = id if id else _uuid_pool.next_hex()
         self.title: str = title
         self.description: str = description
         self.priority: str = priority
@@ -73,7 +160,9 @@ class Task:
             description=data.get("description", ""), # Provide default
             priority=data.get("priority", "Medium"), # Default priority
             due_date=data.get("due_date"),
-            completed=data.get("completed", False)
+            # Normalized to a real bool (e.g. "completed": null in the file), as the
+            # counting and display code uses it as a number and an index
+            completed=bool(data.get("completed", False))
         )
 
     def __repr__(self) -> str:
@@ -84,77 +173,390 @@ class Task:
                 f"due_date='{self.due_date}', completed={self.completed})")
 
 
+class _TaskEncoder(json.JSONEncoder):
+    """JSON encoder that serializes Task objects directly via Task.to_dict()."""
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, Task):
+            return o.to_dict()
+        return super().default(o)
+
+
 class TaskManager:
     """
     Manages a collection of tasks, including loading, saving, and CRUD operations.
 
+    Tasks are persisted as a JSON snapshot plus an append-only journal (one JSON
+    record per line) of the changes made since that snapshot. Each change appends
+    a single record instead of rewriting the whole file; the journal is folded back
+    into the snapshot on load, on close(), and once it reaches JOURNAL_COMPACT_THRESHOLD
+    records. Changes made inside `with manager.batch():` are written to the journal
+    together when the block exits.
+
+    With `lazy=True` the tasks are not loaded by the constructor; call load_async()
+    to load them on a background thread, and do not use the manager (other than
+    `is_loaded`, `load_error` and close()) until `is_loaded` is True.
+
     Attributes:
         filepath (str): The path to the JSON file used for storing tasks.
-        tasks (List[Task]): A list of Task objects currently managed.
+        journal_path (str): The path to the journal of changes not yet in `filepath`.
+        tasks_by_id (Dict[str, Task]): The managed tasks keyed by ID, in the order they were added.
+        load_error (Optional[Exception]): The error that stopped a background load, if any.
     """
 
-    def __init__(self, filepath: str = 'tasks.json'):
+    def __init__(self, filepath: str = 'tasks.json', lazy: bool = False):
         """
         Initializes the TaskManager.
 
         Args:
             filepath: The path to the JSON file for storing tasks. Defaults to 'tasks.json'.
                       The TaskManager will attempt to load tasks from this file.
+            lazy: Optional. If True, the tasks are not loaded here; call load_async().
+                  Defaults to False.
         """
         self.filepath: str = filepath
-        self.tasks: List[Task] = []
-        self._load_tasks()
+        self.journal_path: str = filepath + '.log'
+        # Primary container: dicts keep insertion order and give O(1) lookup and removal by ID
+        self.tasks_by_id: Dict[str, Task] = {}
+        # Journal file handle (opened on first append) and number of records it holds
+        self._journal: Optional[BinaryIO] = None
+        self._journal_records: int = 0
+        # Change records not yet written to the journal, and the nesting depth of batch()
+        self._pending_records: List[Dict[str, Any]] = []
+        self._batch_depth: int = 0
+        # Sort index: one (due_date, priority rank, insertion sequence, task) entry per
+        # task, kept in order as tasks change so listing them in order needs no sort.
+        self._sorted_entries: List[Tuple[str, int, int, Task]] = []
+        self._sort_entry_by_id: Dict[str, Tuple[str, int, int, Task]] = {}
+        self._next_sequence: int = 0
+        # Secondary indexes for the filter queries: priority level / completion status ->
+        # {task ID: Task}. Dicts keep insertion order and allow O(1) removal.
+        self._by_priority: Dict[str, Dict[str, Task]] = {p: {} for p in VALID_PRIORITIES}
+        self._by_completion: Dict[bool, Dict[str, Task]] = {True: {}, False: {}}
+        # Incremented on every change to the tasks; cached views are only valid for the
+        # version they were built at
+        self._version: int = 0
+        # Cached results of get_task_counts() and get_all_tasks(); None until computed or after a change
+        self._task_counts: Optional[Tuple[int, int, Dict[str, int]]] = None
+        self._all_tasks: Optional[Tuple[Task, ...]] = None
+        # Cached get_filtered_tasks() results keyed by (priority_level, completed_status),
+        # and the version they belong to
+        self._views: Dict[Tuple[Optional[str], Optional[bool]], List[Task]] = {}
+        self._views_version: int = 0
+        # Set once the tasks have been loaded (or loading has failed)
+        self._loaded = threading.Event()
+        self._loader: Optional[threading.Thread] = None  # Thread started by load_async()
+        self.load_error: Optional[Exception] = None
+        if not lazy:
+            self._load_tasks()
+            self._loaded.set()
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once the tasks have been loaded, or a background load has failed (see `load_error`)."""
+        return self._loaded.is_set()
+
+    def load_async(self) -> threading.Thread:
+        """
+        Loads the tasks on a background thread, so a caller such as the GUI can
+        start up meanwhile. Poll `is_loaded` to find out when it is done; if loading
+        raised an error, it is stored in `load_error` instead of propagating.
+        The thread is not a daemon: loading may compact (rewrite) the task file, which
+        must not be cut off by interpreter shutdown. close() waits for it.
+
+        Returns:
+            The started loader thread.
+        """
+        self._loader = threading.Thread(target=self._load_in_background, name="TaskManager-load")
+        self._loader.start()
+        return self._loader
+
+    def _load_in_background(self) -> None:
+        """Thread target of load_async(): loads the tasks and records any error in `load_error`."""
+        try:
+            self._load_tasks()
+        except Exception as e: # Handed over to the main thread via load_error, not swallowed
+            print(f"An error occurred while loading tasks: {e}")
+            self.load_error = e
+        finally:
+            self._loaded.set()
 
     def _validate_due_date(self, due_date: str) -> None:
         """Helper method to validate the due_date format."""
+        match = _DATE_RE.fullmatch(due_date)
+        if not match:
+            raise ValueError("Due date must be in YYYY-MM-DD format.")
+        year, month, day = map(int, match.groups())
         try:
-            datetime.strptime(due_date, "%Y-%m-%d")
+            datetime(year, month, day)
         except ValueError:
             raise ValueError("Due date must be in YYYY-MM-DD format.")
 
     def _validate_priority(self, priority: str) -> None:
         """Helper method to validate the priority value."""
-        if priority not in VALID_PRIORITIES:
+        if priority not in _VALID_PRIORITIES_SET:
             raise ValueError(f"Priority must be one of {', '.join(VALID_PRIORITIES)}.")
 
+    def _invalidate_caches(self) -> None:
+        """Drops data derived from the task list. Called after every change to the tasks."""
+        self._version += 1
+        self._task_counts = None
+        self._all_tasks = None
+
+    def _index_task(self, task: Task, sequence: Optional[int] = None) -> None:
+        """
+        Inserts a task into the sort index.
+
+        Args:
+            task: The task to insert.
+            sequence: Optional. The insertion sequence number to keep (used when
+                      re-indexing an edited task); a new one is assigned if None.
+        """
+        if sequence is None:
+            sequence = self._next_sequence
+            self._next_sequence += 1
+        # The sequence is unique, so comparisons never reach the Task itself
+        entry = (task.due_date or "", _PRIORITY_RANK.get(task.priority, len(VALID_PRIORITIES)),
+                 sequence, task)
+        bisect.insort(self._sorted_entries, entry)
+        self._sort_entry_by_id[task.id] = entry
+
+    def _bucket_task(self, task: Task) -> None:
+        """Adds a task to the priority and completion indexes."""
+        # setdefault: tasks loaded from a file may carry a priority outside VALID_PRIORITIES
+        self._by_priority.setdefault(task.priority, {})[task.id] = task
+        self._by_completion[bool(task.completed)][task.id] = task
+
+    def _unbucket_task(self, task: Task) -> None:
+        """Removes a task from the priority and completion indexes."""
+        del self._by_priority[task.priority][task.id]
+        del self._by_completion[bool(task.completed)][task.id]
+
+    def _unindex_task(self, task: Task) -> int:
+        """
+        Removes a task from the sort index.
+
+        Args:
+            task: The task to remove.
+
+        Returns:
+            The insertion sequence number of the removed entry.
+        """
+        entry = self._sort_entry_by_id.pop(task.id)
+        del self._sorted_entries[bisect.bisect_left(self._sorted_entries, entry)]
+        return entry[2]
+
+    def _rebuild_index(self) -> None:
+        """Rebuilds the sort and filter indexes from scratch for the current tasks."""
+        self._sorted_entries = []
+        self._sort_entry_by_id = {}
+        self._next_sequence = 0
+        self._by_priority = {p: {} for p in VALID_PRIORITIES}
+        self._by_completion = {True: {}, False: {}}
+        for task in self.tasks_by_id.values():
+            self._index_task(task)
+            self._bucket_task(task)
+
     def _load_tasks(self) -> None:
         """
-        Loads tasks from the JSON file specified by `self.filepath`.
+        Loads tasks from the JSON file specified by `self.filepath`, then replays the
+        journaled changes on top of it and compacts them into a fresh snapshot.
         If the file is not found, the task list remains empty.
-        If the file contains invalid JSON, an error message is printed, and the list remains empty.
-        """
+        If the file contains invalid JSON, an error message is printed, the list remains empty
+        (apart from journaled changes), the file is kept as `<filepath>.corrupt` for manual
+        recovery, and no compaction happens on load.
+        Files over STREAM_LOAD_THRESHOLD bytes are parsed one task at a time when ijson is
+        installed, so the whole document is never held in memory as Python objects at once.
+        Any other error (e.g. a permission problem) propagates to the caller.
+        """
+        snapshot_readable = True
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f: # Specify encoding
-                data = json.load(f)
-                self.tasks = [Task.from_dict(task_data) for task_data in data]
+            with open(self.filepath, 'rb') as f: # Decoded as UTF-8 by the parser
+                if ijson is not None and os.fstat(f.fileno()).st_size > STREAM_LOAD_THRESHOLD:
+                    data = ijson.items(f, 'item')  # Yields one task dictionary at a time
+                else:
+                    data = _loads(f.read())
+                self.tasks_by_id = {task.id: task for task in map(Task.from_dict, data)}
         except FileNotFoundError:
-            self.tasks = []  # Start with an empty list if no file exists
-        except json.JSONDecodeError:
+            self.tasks_by_id = {}  # Start with no tasks if no file exists
+        except _JSON_DECODE_ERRORS:
             print(f"Error: Could not decode JSON from {self.filepath}. Starting with an empty task list.")
-            self.tasks = []
-        except Exception as e: # Catch other potential errors during loading
-            print(f"An unexpected error occurred while loading tasks: {e}")
-            self.tasks = []
+            self.tasks_by_id = {}
+            snapshot_readable = False
+            # Move the unreadable snapshot aside so no later compaction can overwrite it
+            corrupt_path = self.filepath + '.corrupt'
+            os.replace(self.filepath, corrupt_path)
+            print(f"The unreadable task file was kept as {corrupt_path}.")
+        self._journal_records = self._replay_journal()
+        self._rebuild_index()
+        self._invalidate_caches()
+        if self._journal_records and snapshot_readable:
+            self.compact()
+
+    def _replay_journal(self) -> int:
+        """
+        Applies the change records from the journal at `self.journal_path` to `self.tasks_by_id`.
+        Unreadable records (e.g. a line cut short by a crash) are reported and skipped.
 
+        Returns:
+            The number of records read from the journal.
+        """
+        try:
+            with open(self.journal_path, 'rb') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return 0
+
+        tasks_by_id = self.tasks_by_id
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = _loads(line)
+                op = record["op"]
+                if op in ("add", "edit"):  # Both carry the full task state
+                    task = Task.from_dict(record["task"])
+                    tasks_by_id[task.id] = task
+                elif op == "delete":
+                    tasks_by_id.pop(record["id"], None)
+                elif op == "clear":
+                    tasks_by_id.clear()
+            except (ValueError, KeyError, TypeError, AttributeError):
+                print(f"Warning: Skipping an unreadable record in {self.journal_path}.")
+        return len(lines)
+
+    def _append_journal(self, record: Dict[str, Any]) -> None:
+        """
+        Queues one change record for the journal. Outside a batch() block it is
+        written to disk immediately.
 
-    def _save_tasks(self) -> None:
+        Args:
+            record: The change record, e.g. {"op": "add", "task": {...}}.
+        """
+        self._pending_records.append(record)
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the queued change records to the journal in a single write and flushes it to disk.
+        Compacts the journal into the snapshot once it reaches JOURNAL_COMPACT_THRESHOLD records.
+        If the write fails, the records stay queued for the next flush.
+        """
+        if not self._pending_records:
+            return
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_path, 'ab')
+            self._journal.write(b"".join(_dumps(record) + b"\n" for record in self._pending_records))
+            self._journal.flush()
+        except OSError as e:
+            print(f"Error writing to journal {self.journal_path}: {e}")
+            return
+        self._journal_records += len(self._pending_records)
+        self._pending_records = []
+        if self._journal_records >= JOURNAL_COMPACT_THRESHOLD:
+            self.compact()
+
+    @contextmanager
+    def batch(self) -> Iterator['TaskManager']:
+        """
+        Groups several changes so that they reach the journal in one write, e.g. for
+        a bulk import. Blocks may be nested; the records are flushed when the outermost exits.
+
+        Yields:
+            The TaskManager itself.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def _discard_journal(self) -> None:
+        """Closes and deletes the journal file once its changes are part of the snapshot."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing journal {self.journal_path}: {e}")
+            return
+        self._journal_records = 0
+
+    def compact(self) -> None:
+        """
+        Writes a full snapshot of the tasks to `self.filepath` and discards the journal,
+        along with any queued records (the snapshot already contains their changes).
+        The journal is kept if the snapshot could not be written, so no change is lost.
+        """
+        if self._save_tasks():
+            self._pending_records = []
+            self._discard_journal()
+
+    def close(self) -> None:
+        """
+        Compacts any journaled or queued changes into the snapshot and closes the journal file.
+        Should be called on clean shutdown. Waits for a background load (and the
+        compaction it may be doing) to finish first. Nothing is written if the tasks were
+        never (successfully) loaded, so an unloaded manager cannot overwrite the task file.
+        """
+        if self._loader is not None:
+            self._loader.join()
+        if not self._loaded.is_set() or self.load_error is not None:
+            return
+        self.flush()
+        if self._journal_records:
+            self.compact()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _save_tasks(self) -> bool:
         """
         Saves the current list of tasks to the JSON file specified by `self.filepath`.
-        Tasks are serialized to dictionaries before being written as JSON.
+        Each task is converted to a dictionary only as the encoder reaches it,
+        so no list of all task dictionaries is built first.
+        The tasks are written to a temporary file next to `self.filepath`, which then
+        replaces it in one step, so a crash mid-save leaves the previous snapshot intact.
+
+        Returns:
+            True if the snapshot was written, False if an I/O error occurred.
+            Any other error propagates to the caller.
         """
+        temp_path = self.filepath + '.tmp'
+        # Neither encoder accepts a dict view, so pass a (shallow) list of the tasks
+        tasks = list(self.tasks_by_id.values())
         try:
-            with open(self.filepath, 'w', encoding='utf-f') as f: # Specify encoding
-                json.dump([task.to_dict() for task in self.tasks], f, indent=4, ensure_ascii=False)
-        except IOError as e:
-            # Log error or raise a custom exception to be handled by UI/caller
+            if orjson is not None:
+                with open(temp_path, 'wb') as f:
+                    f.write(orjson.dumps(tasks, default=Task.to_dict))
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                with open(temp_path, 'w', encoding='utf-8') as f: # Specify encoding
+                    json.dump(tasks, f, cls=_TaskEncoder, separators=_JSON_SEPARATORS, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_path, self.filepath)  # Atomic on POSIX and Windows
+            return True
+        except OSError as e: # Also covers PermissionError, disk full, etc.
             print(f"Error saving tasks to {self.filepath}: {e}")
-        except Exception as e: # Catch other potential errors during saving
-            print(f"An unexpected error occurred while saving tasks: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        return False
 
 
     def add_task(self, title: str, description: str, priority: str, due_date: str) -> Task:
         """
-        Creates a new task, adds it to the manager's list, and saves all tasks.
+        Creates a new task, adds it to the manager, and journals the addition.
 
         Args:
             title: The title of the task.
@@ -173,13 +575,16 @@ class TaskManager:
 
         new_task = Task(title=title, description=description,
                         priority=priority, due_date=due_date)
-        self.tasks.append(new_task)
-        self._save_tasks()
+        self.tasks_by_id[new_task.id] = new_task
+        self._index_task(new_task)
+        self._bucket_task(new_task)
+        self._invalidate_caches()
+        self._append_journal({"op": "add", "task": new_task.to_dict()})
         return new_task
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """
-        Retrieves a specific task by its unique ID.
+        Retrieves a specific task by its unique ID (a dictionary lookup, not a list scan).
 
         Args:
             task_id: The ID of the task to find.
@@ -187,10 +592,7 @@ class TaskManager:
         Returns:
             The Task object if found, otherwise None.
         """
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self.tasks_by_id.get(task_id)
 
     def edit_task(self, task_id: str, title: Optional[str] = None,
                   description: Optional[str] = None, priority: Optional[str] = None,
@@ -217,32 +619,50 @@ class TaskManager:
         if not task:
             return False
 
-        changes_made = False
+        # Validate everything before changing anything, so an invalid value never
+        # leaves the task half-edited
+        if priority is not None:
+            self._validate_priority(priority)
+        if due_date is not None:
+            self._validate_due_date(due_date)
+        if all(value is None for value in (title, description, priority, due_date, completed)):
+            return True  # Nothing to change
+
+        # Only move the task within the indexes if a value they use actually changes;
+        # re-bucketing would otherwise move it to the end of its buckets on every edit
+        priority_changed = priority is not None and priority != task.priority
+        rebucket = priority_changed or (completed is not None
+                                        and bool(completed) != bool(task.completed))
+        reindex = priority_changed or (due_date is not None and due_date != task.due_date)
+        if rebucket:
+            self._unbucket_task(task)
+        if reindex:
+            sequence = self._unindex_task(task)
+
         if title is not None:
             task.title = title
-            changes_made = True
         if description is not None:
             task.description = description
-            changes_made = True
         if priority is not None:
-            self._validate_priority(priority)
             task.priority = priority
-            changes_made = True
         if due_date is not None:
-            self._validate_due_date(due_date)
             task.due_date = due_date
-            changes_made = True
         if completed is not None:
             task.completed = completed
-            changes_made = True
 
-        if changes_made:
-            self._save_tasks()
+        if rebucket:
+            self._bucket_task(task)
+        if reindex:
+            # Back into the sort index at its new position, keeping its insertion sequence
+            self._index_task(task, sequence)
+
+        self._invalidate_caches()
+        self._append_journal({"op": "edit", "task": task.to_dict()})
         return True
 
     def delete_task(self, task_id: str) -> bool:
         """
-        Deletes a task from the manager's list by its ID.
+        Deletes a task from the manager by its ID (a dictionary removal, not a list scan).
 
         Args:
             task_id: The ID of the task to delete.
@@ -250,12 +670,14 @@ class TaskManager:
         Returns:
             True if the task was found and deleted, False otherwise.
         """
-        task_to_delete = self.get_task(task_id)
-        if task_to_delete:
-            self.tasks.remove(task_to_delete)
-            self._save_tasks()
-            return True
-        return False
+        task_to_delete = self.tasks_by_id.pop(task_id, None)  # Lookup and removal in one step
+        if task_to_delete is None:
+            return False
+        self._unindex_task(task_to_delete)
+        self._unbucket_task(task_to_delete)
+        self._invalidate_caches()
+        self._append_journal({"op": "delete", "id": task_id})
+        return True
 
     def toggle_complete(self, task_id: str) -> bool:
         """
@@ -267,27 +689,51 @@ class TaskManager:
         Returns:
             True if the task was found and its status toggled, False otherwise.
         """
-        task = self.get_task(task_id)
-        if task:
-            task.completed = not task.completed
-            self._save_tasks()
-            return True
-        return False
+        task = self.tasks_by_id.get(task_id)
+        if task is None:
+            return False
+        self._unbucket_task(task)
+        task.completed = not task.completed
+        self._bucket_task(task)
+        self._invalidate_caches()
+        self._append_journal({"op": "edit", "task": task.to_dict()})
+        return True
+
+    def __len__(self) -> int:
+        """
+        Returns the number of managed tasks without copying the tasks.
+        Note that this makes an empty TaskManager falsy; test for None explicitly.
+        """
+        return len(self.tasks_by_id)
+
+    def get_all_tasks(self) -> Tuple[Task, ...]:
+        """
+        Returns all tasks, in the order they were added, as an immutable tuple.
+        The tuple is built once and shared by all callers until the tasks next change;
+        note that modifying the Task objects within it does affect the managed tasks.
+
+        Returns:
+            A tuple of all Task objects.
+        """
+        if self._all_tasks is None:
+            self._all_tasks = tuple(self.tasks_by_id.values())
+        return self._all_tasks
 
-    def get_all_tasks(self) -> List[Task]:
+    def get_sorted_tasks(self) -> List[Task]:
         """
-        Returns a shallow copy of the list of all tasks.
-        Modifying the returned list will not affect the TaskManager's internal list,
-        but modifying the Task objects within the list will affect them.
+        Returns all tasks sorted by due date (ascending), then by priority (High, Medium, Low).
+        Ties keep the order in which the tasks were added. The order is maintained
+        incrementally as tasks change, so no sorting happens here.
 
         Returns:
-            A list of all Task objects.
+            A new list of all Task objects in sorted order.
         """
-        return self.tasks[:]  # Return a copy
+        return self.get_filtered_tasks()
 
     def get_tasks_by_priority(self, priority_level: str) -> List[Task]:
         """
-        Retrieves a list of tasks that match the specified priority level.
+        Retrieves a list of tasks that match the specified priority level,
+        read from the priority index rather than by scanning all tasks.
 
         Args:
             priority_level: The priority level to filter by.
@@ -299,11 +745,12 @@ class TaskManager:
             ValueError: If `priority_level` is invalid.
         """
         self._validate_priority(priority_level)
-        return [task for task in self.tasks if task.priority == priority_level]
+        return list(self._by_priority[priority_level].values())
 
     def get_tasks_by_completion(self, completed_status: bool) -> List[Task]:
         """
-        Retrieves a list of tasks based on their completion status.
+        Retrieves a list of tasks based on their completion status,
+        read from the completion index rather than by scanning all tasks.
 
         Args:
             completed_status: True to get completed tasks, False for pending tasks.
@@ -311,12 +758,68 @@ class TaskManager:
         Returns:
             A list of tasks matching the criteria.
         """
-        return [task for task in self.tasks if task.completed == completed_status]
+        return list(self._by_completion[bool(completed_status)].values())
+
+    def get_filtered_tasks(self, priority_level: Optional[str] = None,
+                           completed_status: Optional[bool] = None) -> List[Task]:
+        """
+        Retrieves the tasks matching both criteria in a single pass over the task list,
+        in the same order as get_sorted_tasks(). A criterion left as None matches every task.
+        Results are cached per criteria until the tasks next change, so repeating a query
+        on unchanged tasks only copies the cached list.
+
+        Args:
+            priority_level: Optional. The priority level to filter by.
+            completed_status: Optional. True for completed tasks, False for pending tasks.
+
+        Returns:
+            A list of tasks matching the criteria.
+
+        Raises:
+            ValueError: If `priority_level` (if provided) is invalid.
+        """
+        if priority_level is not None:
+            self._validate_priority(priority_level)
+        if self._views_version != self._version:
+            self._views.clear()  # Built from an older version of the tasks
+            self._views_version = self._version
+        key = (priority_level, None if completed_status is None else bool(completed_status))
+        view = self._views.get(key)
+        if view is None:
+            view = self._views[key] = [
+                task for _, _, _, task in self._sorted_entries
+                if (priority_level is None or task.priority == priority_level)
+                and (completed_status is None or task.completed == completed_status)]
+        return view[:]  # Copy so callers cannot alter the cache
+
+    def get_task_counts(self) -> Tuple[int, int, Dict[str, int]]:
+        """
+        Counts tasks by completion status and priority.
+        The result is cached until the tasks are next modified.
+
+        Returns:
+            A tuple (total, completed, priority_counts), where priority_counts maps
+            every level in VALID_PRIORITIES to its number of tasks.
+        """
+        if self._task_counts is None:
+            # map/attrgetter/sum and list.count run entirely in C, without a
+            # per-task Python branch (one scan per priority level)
+            tasks = self.tasks_by_id.values()
+            completed = sum(map(attrgetter("completed"), tasks))
+            priorities = list(map(attrgetter("priority"), tasks))
+            priority_counts = {p: priorities.count(p) for p in VALID_PRIORITIES}
+            self._task_counts = (len(tasks), completed, priority_counts)
+        total, completed, priority_counts = self._task_counts
+        return total, completed, dict(priority_counts)  # Copy so callers cannot alter the cache
 
     def clear_all_tasks(self) -> None:
         """
         Removes all tasks from the TaskManager and clears the storage file.
         This action is irreversible for the current session's data and the file.
         """
-        self.tasks = []
-        self._save_tasks()  # Writes an empty list to the file
+        self.tasks_by_id = {}
+        self._rebuild_index()
+        self._invalidate_caches()
+        # Journal the clear first, so it survives even if writing the empty snapshot fails
+        self._append_journal({"op": "clear"})
+        self.compact()  # Writes an empty list to the file